@@ -5,21 +5,52 @@ A Flask-based web application for managing calendar events via CalDAV
 """
 
 import os
-import json
+import gzip
+import itertools
+import re
 import secrets
 import sys
 import logging
-from datetime import datetime, timedelta
+import threading
+import time
+import zlib
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from functools import lru_cache
+from datetime import date, datetime, timedelta, timezone
+from dateutil.rrule import rrulestr
 from flask import Flask, render_template, request, jsonify, redirect, url_for, session
+from flask.json.provider import DefaultJSONProvider
 import caldav
+from caldav.elements import dav
 from caldav.lib import error
-import pytz
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from icalendar import Calendar, Event as ICalEvent, vRecur
-from icalendar.prop import vDatetime, vDDDLists
+from icalendar.prop import vDatetime, vDDDLists, vDuration
 import uuid
 from dotenv import load_dotenv
 from urllib.parse import unquote
-import traceback
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
+try:
+    from flask_session import Session
+except ImportError:
+    Session = None
+
+try:
+    import redis
+except ImportError:
+    redis = None
 
 # Load environment variables
 load_dotenv()
@@ -32,17 +63,65 @@ logging.basicConfig(
     handlers=[logging.StreamHandler(sys.stdout)]
 )
 
+class ISOJSONProvider(DefaultJSONProvider):
+    """Stdlib JSON provider that writes dates as ISO 8601, the same way orjson does"""
+    
+    @staticmethod
+    def default(o):
+        if isinstance(o, date):
+            return o.isoformat()
+        return DefaultJSONProvider.default(o)
+
+class ORJSONProvider(ISOJSONProvider):
+    """JSON provider that serializes responses with orjson"""
+    
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj, default=self.default).decode()
+    
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+    
+    def response(self, *args, **kwargs):
+        # Hand orjson's bytes straight to the response, skipping the str round trip
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(orjson.dumps(obj, default=self.default),
+                                        mimetype=self.mimetype)
+
 # Create Flask app
 app = Flask(__name__)
+app.json = ORJSONProvider(app) if orjson is not None else ISOJSONProvider(app)
 
 # Configuration
 app.config['SECRET_KEY'] = os.environ.get('SECRET_KEY', secrets.token_hex(32))
 app.config['PERMANENT_SESSION_LIFETIME'] = timedelta(days=int(os.environ.get('SESSION_LIFETIME_DAYS', 7)))
 
+# Keep sessions in Redis or on disk when configured, so the cookie only carries a session id
+REDIS_URL = os.environ.get('REDIS_URL')
+SESSION_FILE_DIR = os.environ.get('SESSION_FILE_DIR')
+if REDIS_URL and (Session is None or redis is None):
+    app.logger.warning("REDIS_URL is set but flask-session/redis are not installed, using cookie sessions")
+elif SESSION_FILE_DIR and Session is None:
+    app.logger.warning("SESSION_FILE_DIR is set but flask-session is not installed, using cookie sessions")
+elif REDIS_URL:
+    app.config.update(SESSION_TYPE='redis', SESSION_USE_SIGNER=True,
+                      SESSION_REDIS=redis.Redis.from_url(REDIS_URL))
+    Session(app)
+elif SESSION_FILE_DIR:
+    # A shared directory works across gunicorn workers, unlike a per-process dict
+    app.config.update(SESSION_TYPE='filesystem', SESSION_USE_SIGNER=True,
+                      SESSION_FILE_DIR=SESSION_FILE_DIR)
+    Session(app)
+
 # CalDAV Configuration
 CALDAV_SERVER_URL = os.environ.get('CALDAV_SERVER_URL', 'https://your-caldav-server.com')
 CALDAV_SERVER_TYPE = os.environ.get('CALDAV_SERVER_TYPE', 'nextcloud')
 
+# Colors handed out in order to calendars without a configured color
+DEFAULT_CALENDAR_COLORS = (
+    '#3788d8', '#28a745', '#dc3545', '#ffc107', '#6f42c1',
+    '#fd7e14', '#20c997', '#e83e8c', '#6c757d', '#17a2b8'
+)
+
 # CalDAV URL patterns for different servers
 CALDAV_URL_PATTERNS = {
     'nextcloud': '{base_url}/remote.php/dav/calendars/{username}/',
@@ -50,6 +129,333 @@ CALDAV_URL_PATTERNS = {
     'radicale': '{base_url}/{username}/',
     'generic': '{base_url}/calendars/{username}/'
 }
+DEFAULT_CALDAV_URL_PATTERN = CALDAV_URL_PATTERNS['generic']
+
+class LRUCache:
+    """Small thread-safe least-recently-used mapping for process-wide caches"""
+    
+    def __init__(self, maxsize):
+        self.maxsize = maxsize
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def get(self, key, default=None):
+        with self._lock:
+            if key not in self._data:
+                return default
+            self._data.move_to_end(key)
+            return self._data[key]
+    
+    def set(self, key, value):
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            if len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+    
+    def pop(self, key, default=None):
+        with self._lock:
+            return self._data.pop(key, default)
+
+# Connected (DAVClient, principal, created) tuples keyed by credentials and URL
+CONNECTION_CACHE = LRUCache(maxsize=128)
+CONNECTION_TTL = 300
+
+# (listed at, calendars, calendars by display name) keyed like CONNECTION_CACHE
+CALENDAR_LIST_CACHE = LRUCache(maxsize=128)
+CALENDAR_LIST_TTL = 60
+
+# (ETag, parsed base events) keyed by object URL; a changed object gets a new ETag
+PARSED_EVENT_CACHE = LRUCache(maxsize=4096)
+
+# Calendar URLs whose server rejected a time-range REPORT, mapped to when it failed
+TIME_RANGE_FAILURES = LRUCache(maxsize=256)
+TIME_RANGE_RETRY_AFTER = 300
+
+# Concurrent downloads when a listing comes back without calendar data
+OBJECT_LOAD_WORKERS = 8
+
+# Worker threads used to fetch selected calendars side by side
+CALENDAR_FETCH_WORKERS = 8
+
+# Optional binary encoding for /api/events clients that ask for it
+MSGPACK_MIMETYPE = 'application/msgpack'
+MSGPACK_ENCODER = msgspec.msgpack.Encoder() if msgspec is not None else None
+
+# Responses smaller than this are not worth gzipping
+COMPRESS_MIN_SIZE = 500
+COMPRESS_LEVEL = 5
+
+# Keep-alive pool per DAVClient session; sized so concurrent loads never block
+HTTP_POOL_CONNECTIONS = 16
+HTTP_POOL_MAXSIZE = 32
+
+# Pre-compiled patterns for inspecting raw iCalendar/RRULE text
+UNTIL_PATTERN = re.compile(r'UNTIL=([0-9TZ]+)')
+COUNT_PATTERN = re.compile(r'COUNT=(\d+)')
+INTERVAL_PATTERN = re.compile(r'INTERVAL=(\d+)')
+FREQ_PATTERN = re.compile(r'FREQ=(\w+)')
+RRULE_PART_PATTERN = re.compile(r'([A-Za-z-]+)\s*=([^;]*)')
+RRULE_INT_PARTS = frozenset({'INTERVAL', 'COUNT'})
+FREEBUSY_PATTERN = re.compile(r'^FREEBUSY(?:;[^:\n]*)?:(.*)$', re.M | re.I)
+ICAL_DATE_PATTERN = re.compile(
+    r'(\d{4})-?(\d{2})-?(\d{2})(?:T?(\d{2})(?::?(\d{2})(?::?(\d{2}))?)?)?')
+TEXT_ESCAPE_PATTERN = re.compile(r'\\([\\;,nN])')
+FOLDED_LINE_PATTERN = re.compile(r'\n[ \t]')
+
+def forget_connection(cache_key):
+    """Drop a cached connection and calendar listing, closing the connection's sockets"""
+    CALENDAR_LIST_CACHE.pop(cache_key)
+    cached = CONNECTION_CACHE.pop(cache_key)
+    if cached:
+        cached[0].session.close()
+
+def report_rejected(exc):
+    """Whether a REPORT failed because the server refused it (4xx), not a timeout or server error"""
+    if not isinstance(exc, error.ReportError):
+        return False
+    # caldav puts the response's "<status> <reason>" at the start of the error's url
+    status = str(exc.url).partition(' ')[0]
+    return status.isdigit() and status.startswith('4')
+
+def object_etag(obj):
+    """Return a calendar object's ETag if the server reported one"""
+    return (getattr(obj, 'props', None) or {}).get(dav.GetEtag.tag)
+
+def object_data(obj):
+    """Return the iCalendar body a calendar object already holds, if any"""
+    return getattr(obj, 'data', None)
+
+def forget_parsed_event(obj):
+    """Drop a calendar object's parsed events after it was changed or deleted"""
+    PARSED_EVENT_CACHE.pop(str(getattr(obj, 'url', '')))
+
+def load_object_data(obj):
+    """Download a calendar object's data, returning None on failure"""
+    try:
+        obj.load()
+        return object_data(obj)
+    except Exception as e:
+        app.logger.debug("Failed to load calendar object %s: %s", getattr(obj, 'url', None), e)
+        return None
+
+def ical_property_date(ical_text, name, start=0):
+    """Return the YYYYMMDD prefix of the first value of a property, or None"""
+    pos = ical_text.find('\n' + name, start)
+    if pos < 0:
+        return None
+    colon = ical_text.find(':', pos)
+    if colon < 0:
+        return None
+    value = ical_text[colon + 1:colon + 9]
+    return value if value.isdigit() else None
+
+def may_overlap_range(ical_text, range_start, range_end):
+    """Cheaply decide from raw text whether a single non-recurring VEVENT can touch a YYYYMMDD range
+    
+    Anything it cannot rule out (recurrences, several VEVENTs, odd values) counts as a possible match.
+    """
+    if not isinstance(ical_text, str) or ical_text.count('BEGIN:VEVENT') != 1:
+        return True
+    if 'RRULE' in ical_text or 'RDATE' in ical_text:
+        return True
+    # Start after BEGIN:VEVENT so VTIMEZONE's DTSTART lines are not picked up
+    vevent_pos = ical_text.find('BEGIN:VEVENT')
+    event_start = ical_property_date(ical_text, 'DTSTART', vevent_pos)
+    if event_start and event_start > range_end:
+        return False
+    event_end = ical_property_date(ical_text, 'DTEND', vevent_pos)
+    if event_end and event_end < range_start:
+        return False
+    return True
+
+def calendar_display_name(cal):
+    """Return a calendar's display name
+    
+    principal.calendars() reads {DAV:}displayname for every calendar in a single
+    Depth: 1 PROPFIND, so a missing name is not worth another round trip.
+    """
+    display_name = cal.name
+    if not display_name or display_name == 'None':
+        return 'Unnamed Calendar'
+    return display_name
+
+def naive(value):
+    """Drop tzinfo from a datetime, returning the same object when it is already naive"""
+    if getattr(value, 'tzinfo', None) is None:
+        return value
+    return value.replace(tzinfo=None)
+
+def parse_iso_utc(value):
+    """Parse an ISO 8601 timestamp, accepting the trailing 'Z' that browsers send"""
+    if value.endswith('Z'):
+        value = value[:-1] + '+00:00'
+    return datetime.fromisoformat(value)
+
+def to_date(value):
+    """Return the calendar date of a date or datetime value"""
+    return value.date() if isinstance(value, datetime) else value
+
+def parse_ical_datetime(value):
+    """Parse an iCalendar DATE or DATE-TIME value into a naive date/datetime
+    
+    TZID parameters and the UTC suffix are deliberately ignored: events are shown in
+    their wall-clock time, so no VTIMEZONE needs to be resolved.
+    """
+    value = value.strip()
+    # Since Python 3.11 the C fromisoformat parsers accept the basic YYYYMMDD[THHMMSS] form
+    if len(value) == 8:
+        return date.fromisoformat(value)
+    if len(value) >= 15 and value[8] == 'T':
+        return datetime.fromisoformat(value[:15])
+    raise ValueError(f"Unsupported iCalendar date value: {value}")
+
+def unescape_ical_text(value):
+    """Undo RFC 5545 TEXT escaping"""
+    if '\\' not in value:
+        return value
+    return TEXT_ESCAPE_PATTERN.sub(
+        lambda m: '\n' if m.group(1) in 'nN' else m.group(1), value)
+
+@lru_cache(maxsize=2048)
+def compile_rrule(rrule_text, dtstart):
+    """Build a dateutil rule once per (RRULE text, DTSTART) pair"""
+    return rrulestr(rrule_text, dtstart=dtstart, ignoretz=True)
+
+# Frequencies whose periods are a fixed number of days, so DTSTART can be moved by whole periods
+FIXED_PERIOD_DAYS = {'DAILY': 1, 'WEEKLY': 7}
+
+def fast_forward_dtstart(rrule_text, dtstart, window_start):
+    """Move DTSTART of an uncounted daily/weekly rule to the last period start before a window"""
+    if dtstart >= window_start or COUNT_PATTERN.search(rrule_text):
+        return dtstart
+    freq_match = FREQ_PATTERN.search(rrule_text)
+    days = FIXED_PERIOD_DAYS.get(freq_match.group(1).upper()) if freq_match else None
+    if not days:
+        return dtstart
+    interval_match = INTERVAL_PATTERN.search(rrule_text)
+    period = timedelta(days=days * (int(interval_match.group(1)) if interval_match else 1))
+    return dtstart + (window_start - dtstart) // period * period
+
+# Frequencies whose periods are a fixed number of months, stepped with month arithmetic
+PERIOD_MONTHS = {'MONTHLY': 1, 'YEARLY': 12}
+
+@lru_cache(maxsize=2048)
+def plain_rule_parts(rrule_text):
+    """Return (FREQ, INTERVAL, COUNT, UNTIL) for a rule with only INTERVAL and COUNT or UNTIL, else None"""
+    parts = {key.upper(): value.strip() for key, value in RRULE_PART_PATTERN.findall(rrule_text)}
+    freq = parts.pop('FREQ', '').upper()
+    if freq not in FIXED_PERIOD_DAYS and freq not in PERIOD_MONTHS:
+        return None
+    if not parts.keys() <= {'INTERVAL', 'COUNT', 'UNTIL'} or len(parts.keys() & {'COUNT', 'UNTIL'}) > 1:
+        return None
+    try:
+        interval = int(parts.get('INTERVAL', 1))
+        count = int(parts['COUNT']) if 'COUNT' in parts else None
+        until = parse_ical_datetime(parts['UNTIL']) if 'UNTIL' in parts else None
+    except ValueError:
+        return None
+    if interval < 1:
+        return None
+    if until is not None and not isinstance(until, datetime):
+        until = datetime.combine(until, datetime.min.time())
+    return freq, interval, count, until
+
+@lru_cache(maxsize=2048)
+def rrule_bounds(rrule_text):
+    """Return (UNTIL as a datetime, days a COUNT-limited series can span) for cheap window checks
+
+    Either is None when the rule does not bound it. BY* parts can skip whole periods, so COUNT
+    is only turned into a span for plain rules and for WEEKLY rules whose only BY* part is BYDAY.
+    MONTHLY/YEARLY rules get no span: dateutil skips months and years lacking DTSTART's day,
+    so their length depends on DTSTART and not just the rule text.
+    """
+    until_match = UNTIL_PATTERN.search(rrule_text)
+    if until_match:
+        try:
+            until = parse_ical_datetime(until_match.group(1))
+        except ValueError:
+            return None, None
+        if not isinstance(until, datetime):
+            until = datetime.combine(until, datetime.min.time())
+        return until, None
+    
+    count_match = COUNT_PATTERN.search(rrule_text)
+    freq_match = FREQ_PATTERN.search(rrule_text)
+    if not count_match or not freq_match:
+        return None, None
+    freq = freq_match.group(1).upper()
+    step_days = FIXED_PERIOD_DAYS.get(freq)
+    if not step_days:
+        return None, None
+    count = int(count_match.group(1))
+    by_parts = {key.upper() for key, _ in RRULE_PART_PATTERN.findall(rrule_text) if key.upper().startswith('BY')}
+    if not by_parts:
+        periods = count - 1
+    elif by_parts == {'BYDAY'} and freq == 'WEEKLY':
+        # Every week after the first has a matching day, so COUNT occurrences fit in COUNT + 1 weeks
+        periods = count + 1
+    else:
+        return None, None
+    interval_match = INTERVAL_PATTERN.search(rrule_text)
+    interval = int(interval_match.group(1)) if interval_match else 1
+    return None, timedelta(days=periods * interval * step_days)
+
+def plain_rule_occurrences(rule_parts, dtstart, window_start, window_end, limit):
+    """Return up to limit occurrences of a plain rule in the window, or None when dateutil is needed"""
+    freq, interval, count, until = rule_parts
+    last = window_end if until is None else min(window_end, until)
+    if last < dtstart:
+        return []
+    if freq in FIXED_PERIOD_DAYS:
+        period = timedelta(days=FIXED_PERIOD_DAYS[freq] * interval)
+        # Index range in closed form: ceil((window_start - dtstart) / period) up to floor((last - dtstart) / period)
+        first = max(0, -((dtstart - window_start) // period))
+        stop = (last - dtstart) // period + 1
+        nth = lambda index: dtstart + index * period
+    else:
+        # Days past the 28th are missing from some months and dateutil skips those months
+        if dtstart.day > 28:
+            return None
+        step = PERIOD_MONTHS[freq] * interval
+        base = dtstart.year * 12 + dtstart.month - 1
+        
+        def nth(index):
+            month = base + index * step
+            return dtstart.replace(year=month // 12, month=month % 12 + 1)
+        
+        # Same closed form on month numbers, then one step of correction for the day and time
+        first = max(0, -((base - window_start.year * 12 - window_start.month + 1) // step))
+        if nth(first) < window_start:
+            first += 1
+        stop = (last.year * 12 + last.month - 1 - base) // step + 1
+        if nth(stop - 1) > last:
+            stop -= 1
+    stop = min(stop, first + limit)
+    if count is not None:
+        stop = min(stop, count)
+    return [nth(index) for index in range(first, stop)]
+
+def parse_ical_date_list(value):
+    """Parse a comma separated list of iCalendar DATE/DATE-TIME values"""
+    return [parse_ical_datetime(part) for part in value.split(',')]
+
+# VEVENT property -> (event data key, value parser) used by the fast scanner
+VEVENT_FIELDS = {
+    'UID': ('uid', str),
+    'SUMMARY': ('summary', unescape_ical_text),
+    'DESCRIPTION': ('description', unescape_ical_text),
+    'LOCATION': ('location', unescape_ical_text),
+    'DTSTART': ('start', parse_ical_datetime),
+    'DTEND': ('end', parse_ical_datetime),
+    'RRULE': ('rrule', str),
+    'EXDATE': ('exdates', parse_ical_date_list)
+}
+
+# Patterns for the fast scanner, applied to unfolded LF-terminated text
+NESTED_COMPONENT_PATTERN = re.compile(r'^BEGIN:([\w-]+)\n.*?^END:\1$\n?', re.M | re.S | re.I)
+VEVENT_PROPERTY_PATTERN = re.compile(
+    r'^(%s)(;[^:\n]*)?:(.*)$' % '|'.join(VEVENT_FIELDS), re.M | re.I)
 
 class CalDAVClient:
     def __init__(self, username, password, base_url, server_type='generic'):
@@ -60,81 +466,74 @@ class CalDAVClient:
         self.client = None
         self.principal = None
         self.calendar = None
+        self._selected_name = None
         
     def connect(self):
-        """Connect to CalDAV server"""
+        """Connect to CalDAV server, reusing a recent connection for the same credentials"""
+        cache_key = (self.username, self.password, self.base_url)
+        cached = CONNECTION_CACHE.get(cache_key)
+        if cached and time.monotonic() - cached[2] < CONNECTION_TTL:
+            self.client, self.principal = cached[0], cached[1]
+            return True
+        if cached:
+            # Release the expired client's pooled sockets instead of waiting for GC
+            cached[0].session.close()
+        
         try:
             self.client = caldav.DAVClient(
                 url=self.base_url,
                 username=self.username,
                 password=self.password
             )
+            adapter = HTTPAdapter(pool_connections=HTTP_POOL_CONNECTIONS,
+                                  pool_maxsize=HTTP_POOL_MAXSIZE,
+                                  max_retries=Retry(total=2, backoff_factor=0.2))
+            self.client.session.mount('https://', adapter)
+            self.client.session.mount('http://', adapter)
             self.principal = self.client.principal()
-            app.logger.info(f"Successfully connected to CalDAV server")
+            CONNECTION_CACHE.set(cache_key, (self.client, self.principal, time.monotonic()))
+            app.logger.info("Successfully connected to CalDAV server")
             return True
         except Exception as e:
-            app.logger.error(f"CalDAV connection error: {e}")
+            app.logger.error("CalDAV connection error: %s", e)
             return False
 
-    def delete_event_by_uid(self, uid):
-        """Delete an event by finding it by UID"""
+    def delete_event_by_uid(self, uid, event_url=None):
+        """Delete an event by finding it by URL or UID"""
         try:
             if not self.calendar:
                 app.logger.error("No calendar selected")
                 return False
             
-            # Clean the UID (remove recurrence suffix if present)
-            clean_uid = uid.split('_recurrence_')[0] if '_recurrence_' in uid else uid
-            
-            all_objects = list(self.calendar.objects())
-            
-            for obj in all_objects:
-                try:
-                    raw_data = None
-                    
-                    if hasattr(obj, 'data') and obj.data:
-                        raw_data = obj.data
-                    else:
-                        try:
-                            obj.load()
-                            if hasattr(obj, 'data') and obj.data:
-                                raw_data = obj.data
-                        except:
-                            continue
-                    
-                    if isinstance(raw_data, bytes):
-                        raw_data = raw_data.decode('utf-8', errors='ignore')
-                    
-                    if isinstance(raw_data, str) and f'UID:{clean_uid}' in raw_data:
-                        obj.delete()
-                        app.logger.info("Event deleted successfully")
-                        return True
-                        
-                except Exception as e:
-                    continue
+            obj = self._find_event(uid, event_url)
+            if obj is None:
+                app.logger.warning("Event not found with UID: %s", uid.partition('_recurrence_')[0])
+                return False
             
-            app.logger.warning(f"Event not found with UID: {clean_uid}")
-            return False
+            obj.delete()
+            forget_parsed_event(obj)
+            app.logger.info("Event deleted successfully")
+            return True
             
         except Exception as e:
-            app.logger.error(f"Error deleting event by UID: {e}")
+            app.logger.exception("Error deleting event by UID: %s", e)
             return False
 
     def delete_recurring_occurrence(self, event_url, original_uid, event_date):
         """Delete only a specific occurrence of a recurring event by adding EXDATE"""
         try:
             # Find the original recurring event
-            original_event = self._find_event_by_uid(original_uid)
+            original_event = self._find_event(original_uid, event_url)
             if not original_event:
-                app.logger.error(f"Could not find original event with UID: {original_uid}")
+                app.logger.error("Could not find original event with UID: %s", original_uid)
                 return False
             
             # Load the event data
-            if not hasattr(original_event, 'data') or not original_event.data:
+            if not object_data(original_event):
                 try:
                     original_event.load()
                 except Exception as e:
-                    app.logger.error(f"Failed to load event data: {e}")
+                    app.logger.error("Failed to load event data: %s", e)
                     return False
             
             # Parse event data
@@ -173,24 +572,18 @@ class CalDAVClient:
                             # It's a vDDDLists object
                             for existing_dt in existing_exdate.dts:
                                 if hasattr(existing_dt, 'dt'):
-                                    existing_date = existing_dt.dt
-                                    if hasattr(existing_date, 'tzinfo') and existing_date.tzinfo:
-                                        existing_date = existing_date.replace(tzinfo=None)
+                                    existing_date = naive(existing_dt.dt)
                                     existing_exdates.append(existing_date)
                         elif isinstance(existing_exdate, list):
                             # It's already a list
                             for ex in existing_exdate:
                                 if hasattr(ex, 'dt'):
-                                    existing_date = ex.dt
-                                    if hasattr(existing_date, 'tzinfo') and existing_date.tzinfo:
-                                        existing_date = existing_date.replace(tzinfo=None)
+                                    existing_date = naive(ex.dt)
                                     existing_exdates.append(existing_date)
                         else:
                             # Single existing EXDATE
                             if hasattr(existing_exdate, 'dt'):
-                                existing_date = existing_exdate.dt
-                                if hasattr(existing_date, 'tzinfo') and existing_date.tzinfo:
-                                    existing_date = existing_date.replace(tzinfo=None)
+                                existing_date = naive(existing_exdate.dt)
                                 existing_exdates.append(existing_date)
                     
                     # Check if our target date is already in the EXDATE list
@@ -212,7 +605,6 @@ class CalDAVClient:
                     existing_exdates.append(exception_datetime)
                     
                     # Create a fresh vDDDLists with only the dates we want
-                    from icalendar.prop import vDDDLists, vDatetime
                     new_exdate_list = vDDDLists([])
                     
                     for exdate in existing_exdates:
@@ -232,23 +624,24 @@ class CalDAVClient:
             try:
                 original_event.data = cal.to_ical()
                 original_event.save()
+                forget_parsed_event(original_event)
                 app.logger.info("Successfully saved modified event with EXDATE")
                 return True
             except Exception as e:
-                app.logger.error(f"Failed to save modified event: {e}")
+                app.logger.error("Failed to save modified event: %s", e)
                 return False
                 
         except Exception as e:
-            app.logger.error(f"Error deleting recurring occurrence: {e}")
+            app.logger.exception("Error deleting recurring occurrence: %s", e)
             return False
 
     def delete_recurring_future(self, event_url, original_uid, event_date):
         """Delete this occurrence and all future occurrences by modifying RRULE"""
         try:
             # Find the original recurring event
-            original_event = self._find_event_by_uid(original_uid)
+            original_event = self._find_event(original_uid, event_url)
             if not original_event:
-                app.logger.error(f"Could not find original event with UID: {original_uid}")
+                app.logger.error("Could not find original event with UID: %s", original_uid)
                 return False
             
             # Parse event data
@@ -280,37 +673,49 @@ class CalDAVClient:
                         component['rrule'] = new_recur
                     else:
                         # No RRULE found, treat as single event deletion
-                        return self.delete_event_by_uid(original_uid)
+                        return self.delete_event_by_uid(original_uid, event_url)
                     break
             
             # Save modified event
             original_event.data = cal.to_ical()
             original_event.save()
+            forget_parsed_event(original_event)
             app.logger.info("Future recurring events deleted successfully")
             return True
                 
         except Exception as e:
-            app.logger.error(f"Error deleting future recurring events: {e}")
+            app.logger.exception("Error deleting future recurring events: %s", e)
             return False
 
-    def delete_recurring_series(self, original_uid):
+    def delete_recurring_series(self, original_uid, event_url=None):
         """Delete the entire recurring event series"""
         try:
             # Find the original recurring event
-            original_event = self._find_event_by_uid(original_uid)
+            original_event = self._find_event(original_uid, event_url)
             if not original_event:
-                app.logger.error(f"Could not find original event with UID: {original_uid}")
+                app.logger.error("Could not find original event with UID: %s", original_uid)
                 return False
             
             # Delete the entire event
             original_event.delete()
+            forget_parsed_event(original_event)
             app.logger.info("Entire recurring series deleted successfully")
             return True
                 
         except Exception as e:
-            app.logger.error(f"Error deleting recurring series: {e}")
+            app.logger.exception("Error deleting recurring series: %s", e)
             return False
 
+    def _find_event(self, uid, event_url=None):
+        """Fetch an event directly by its URL when the caller knows it, else look it up by UID"""
+        # Only URLs inside the selected calendar are followed, so credentials never go elsewhere
+        if event_url and self.calendar and str(event_url).startswith(str(self.calendar.url)):
+            try:
+                return self.calendar.event_by_url(event_url)
+            except Exception as e:
+                app.logger.debug("Fetching %s failed, looking event up by UID: %s", event_url, e)
+        return self._find_event_by_uid(uid)
+
     def _find_event_by_uid(self, uid):
         """Find an event by its UID"""
         try:
@@ -318,28 +723,25 @@ class CalDAVClient:
                 return None
             
             # Clean the UID (remove recurrence suffix if present)
-            clean_uid = uid.split('_recurrence_')[0] if '_recurrence_' in uid else uid
+            clean_uid = uid.partition('_recurrence_')[0]
             
-            all_objects = list(self.calendar.objects())
+            # A UID text-match REPORT returns just the one object
+            try:
+                return self.calendar.object_by_uid(clean_uid)
+            except Exception as e:
+                app.logger.debug("UID query for %s failed, scanning calendar: %s", clean_uid, e)
             
-            for obj in all_objects:
+            # Walk the listing lazily and stop at the first match; bytes are searched without decoding
+            needle = f'UID:{clean_uid}'
+            needle_bytes = needle.encode('utf-8')
+            for obj in self.calendar.objects():
                 try:
-                    raw_data = None
-                    
-                    if hasattr(obj, 'data') and obj.data:
-                        raw_data = obj.data
-                    else:
-                        try:
-                            obj.load()
-                            if hasattr(obj, 'data') and obj.data:
-                                raw_data = obj.data
-                        except:
-                            continue
+                    raw_data = object_data(obj) or load_object_data(obj)
                     
                     if isinstance(raw_data, bytes):
-                        raw_data = raw_data.decode('utf-8', errors='ignore')
-                    
-                    if isinstance(raw_data, str) and f'UID:{clean_uid}' in raw_data:
+                        if needle_bytes in raw_data:
+                            return obj
+                    elif isinstance(raw_data, str) and needle in raw_data:
                         return obj
                         
                 except Exception:
@@ -348,51 +750,87 @@ class CalDAVClient:
             return None
             
         except Exception as e:
-            app.logger.error(f"Error finding event by UID: {e}")
+            app.logger.error("Error finding event by UID: %s", e)
             return None
     
+    def _get_calendars_cached(self):
+        """Return (calendars, calendars by name), re-listing the calendar home at most every CALENDAR_LIST_TTL seconds"""
+        cache_key = (self.username, self.password, self.base_url)
+        cached = CALENDAR_LIST_CACHE.get(cache_key)
+        if cached and time.monotonic() - cached[0] < CALENDAR_LIST_TTL:
+            return cached[1], cached[2]
+        
+        calendars = self.principal.calendars()
+        calendars_by_name = {}
+        for cal in calendars:
+            # First calendar wins when two share a display name
+            calendars_by_name.setdefault(calendar_display_name(cal), cal)
+        CALENDAR_LIST_CACHE.set(cache_key, (time.monotonic(), calendars, calendars_by_name))
+        return calendars, calendars_by_name
+    
     def get_calendars(self):
         """Get list of available calendars"""
         try:
-            calendars = self.principal.calendars()
-            calendar_list = []
-            for cal in calendars:
-                display_name = cal.name
-                if not display_name or display_name == 'None':
-                    try:
-                        props = cal.get_properties(['{DAV:}displayname'])
-                        display_name = props.get('{DAV:}displayname', 'Unnamed Calendar')
-                    except:
-                        display_name = 'Unnamed Calendar'
-                
-                calendar_list.append((display_name, str(cal.url)))
-            return calendar_list
+            calendars = self._get_calendars_cached()[0]
+            return [(calendar_display_name(cal), str(cal.url)) for cal in calendars]
         except Exception as e:
-            app.logger.error(f"Error getting calendars: {e}")
+            app.logger.error("Error getting calendars: %s", e)
             return []
     
-    def select_calendar(self, calendar_name):
-        """Select a calendar to work with"""
+    def select_calendar(self, calendar_name, calendar_url=None):
+        """Select a calendar to work with, by URL when the caller already knows it"""
+        if self.calendar is not None and calendar_name == self._selected_name:
+            return True
+        
         try:
-            calendars = self.principal.calendars()
-            for cal in calendars:
-                display_name = cal.name
-                if not display_name or display_name == 'None':
-                    try:
-                        props = cal.get_properties(['{DAV:}displayname'])
-                        display_name = props.get('{DAV:}displayname', 'Unnamed Calendar')
-                    except:
-                        display_name = 'Unnamed Calendar'
-                
-                if display_name == calendar_name or cal.name == calendar_name:
-                    self.calendar = cal
-                    return True
-            app.logger.warning(f"Calendar not found: {calendar_name}")
+            if calendar_url:
+                # URL comes from the listing stored at login, so no PROPFIND is needed
+                self.calendar = self.client.calendar(url=calendar_url, name=calendar_name)
+                self._selected_name = calendar_name
+                return True
+            
+            cal = self._get_calendars_cached()[1].get(calendar_name)
+            if cal is not None:
+                self.calendar = cal
+                self._selected_name = calendar_name
+                return True
+            app.logger.warning("Calendar not found: %s", calendar_name)
             return False
         except Exception as e:
-            app.logger.error(f"Error selecting calendar: {e}")
+            app.logger.error("Error selecting calendar: %s", e)
             return False
 
+    def get_freebusy(self, start_date, end_date):
+        """Get busy periods for the selected calendar without fetching or expanding events
+        
+        Returns a list of (start, end) tuples in UTC as reported by the server.
+        """
+        if not self.calendar:
+            return []
+        
+        try:
+            freebusy = self.calendar.freebusy_request(start_date, end_date)
+            ical_text = FOLDED_LINE_PATTERN.sub('', freebusy.data.replace('\r\n', '\n'))
+        except Exception as e:
+            app.logger.error("Error requesting free/busy: %s", e)
+            return []
+        
+        periods = []
+        for match in FREEBUSY_PATTERN.finditer(ical_text):
+            for period in match.group(1).split(','):
+                period_start, _, period_end = period.strip().partition('/')
+                try:
+                    busy_start = parse_ical_datetime(period_start)
+                    if period_end.lstrip('+').startswith('P'):
+                        busy_end = busy_start + vDuration.from_ical(period_end)
+                    else:
+                        busy_end = parse_ical_datetime(period_end)
+                except ValueError:
+                    continue
+                periods.append((busy_start, busy_end))
+        
+        return periods
+
     def get_events(self, start_date, end_date):
         """Get events from calendar with recurring event expansion"""
         if not self.calendar:
@@ -400,114 +838,248 @@ class CalDAVClient:
             return []
         
         try:
-            all_objects = list(self.calendar.objects())
-            event_list = []
+            calendar_url = str(self.calendar.url)
+            failed_at = TIME_RANGE_FAILURES.get(calendar_url)
+            if failed_at and time.monotonic() - failed_at < TIME_RANGE_RETRY_AFTER:
+                # Skip a REPORT this server just rejected instead of paying for it again
+                all_objects = list(self.calendar.objects())
+            else:
+                try:
+                    # Let the server filter by time range with a calendar-query REPORT
+                    all_objects = self.calendar.search(start=start_date, end=end_date, event=True,
+                                                       expand=False, props=[dav.GetEtag()])
+                except Exception as e:
+                    app.logger.warning("Time-range search failed, listing all objects: %s", e)
+                    # Only a refusal is remembered; timeouts and server errors retry the REPORT next time
+                    if report_rejected(e):
+                        TIME_RANGE_FAILURES.set(calendar_url, time.monotonic())
+                    all_objects = list(self.calendar.objects())
             
+            # Look up cached parses first so unchanged objects are never downloaded
+            entries = []
             for i, obj in enumerate(all_objects):
-                try:
-                    # Try multiple methods to get the actual iCalendar data
-                    raw_data = None
-                    
-                    if hasattr(obj, 'data') and obj.data:
-                        raw_data = obj.data
-                    
-                    if not raw_data:
-                        try:
-                            obj.load()
-                            if hasattr(obj, 'data') and obj.data:
-                                raw_data = obj.data
-                        except Exception:
-                            continue
-                    
-                    if not raw_data:
-                        continue
-                    
-                    # Convert to string if needed
-                    if isinstance(raw_data, bytes):
-                        raw_data = raw_data.decode('utf-8', errors='ignore')
-                    
-                    if not isinstance(raw_data, str) or 'BEGIN:VEVENT' not in raw_data:
-                        continue
-                    
-                    obj_url = getattr(obj, 'url', f'/event/{i}')
-                    
-                    # Parse the event(s) - handle recurring events
-                    parsed_events = self._parse_event(raw_data, str(obj_url), start_date, end_date)
-                    
-                    for parsed_event in parsed_events:
-                        # Date range check
-                        event_start = parsed_event['start']
-                        event_end = parsed_event['end']
+                obj_url = str(getattr(obj, 'url', f'/event/{i}'))
+                etag = object_etag(obj)
+                cached = PARSED_EVENT_CACHE.get(obj_url) if etag else None
+                base_events = cached[1] if cached and cached[0] == etag else None
+                raw_data = object_data(obj) if base_events is None else None
+                entries.append([obj, obj_url, base_events, raw_data])
+            
+            # Start downloading bodies the listing did not include; parsing overlaps the downloads
+            pending = [entry for entry in entries if entry[2] is None and not entry[3]]
+            executor = None
+            if pending:
+                executor = ThreadPoolExecutor(max_workers=min(OBJECT_LOAD_WORKERS, len(pending)))
+                for entry in pending:
+                    entry[3] = executor.submit(load_object_data, entry[0])
+            
+            event_list = []
+            range_start = start_date.date()
+            range_end = end_date.date()
+            range_start_text = f"{range_start:%Y%m%d}"
+            range_end_text = f"{range_end:%Y%m%d}"
+            cached_count = 0
+            skipped_count = 0
+            failed_count = 0
+            
+            try:
+                for obj, obj_url, base_events, raw_data in entries:
+                    try:
+                        if base_events is not None:
+                            cached_count += 1
+                        else:
+                            if isinstance(raw_data, Future):
+                                raw_data = raw_data.result()
+                            if not raw_data:
+                                failed_count += 1
+                                continue
+                            
+                            # Servers that ignore the time-range filter return everything
+                            if not may_overlap_range(raw_data, range_start_text, range_end_text):
+                                skipped_count += 1
+                                continue
+                            
+                            # Non-event objects (e.g. VTODO) parse to an empty list and are cached as such
+                            base_events = self._parse_vevents(raw_data, obj_url)
+                            
+                            etag = object_etag(obj)
+                            if etag:
+                                PARSED_EVENT_CACHE.set(obj_url, (etag, base_events))
                         
-                        if (event_start.date() <= end_date.date() and 
-                            event_end.date() >= start_date.date()):
-                            event_list.append(parsed_event)
-                    
-                except Exception:
-                    continue
+                        # Expand recurring events and drop anything outside the requested window,
+                        # consuming the generator straight into the result list
+                        event_list.extend(self._expand_events(base_events, start_date, end_date))
+                        
+                    except Exception:
+                        failed_count += 1
+                        continue
+            finally:
+                if executor:
+                    executor.shutdown()
             
+            # One summary record per call instead of logging inside the loop
+            app.logger.debug("Loaded %d events from %d objects (%d cached, %d skipped, %d failed)",
+                             len(event_list), len(all_objects), cached_count, skipped_count,
+                             failed_count)
             return event_list
             
         except Exception as e:
-            app.logger.error(f"Error in get_events: {e}")
+            if isinstance(e, error.AuthorizationError):
+                # Rejected credentials should not keep being served from the connection cache
+                forget_connection((self.username, self.password, self.base_url))
+            app.logger.exception("Error in get_events: %s", e)
             return []
 
-    def _parse_event(self, ical_text, event_url, start_date, end_date):
-        """Parse iCalendar text and expand recurring events"""
+    def _parse_vevents(self, ical_data, event_url):
+        """Parse iCalendar text into base event data"""
         try:
-            # Ensure string format
-            if isinstance(ical_text, bytes):
-                ical_text = ical_text.decode('utf-8', errors='ignore')
-            
-            # Basic validation
-            if not isinstance(ical_text, str) or 'BEGIN:VEVENT' not in ical_text:
+            # Peek for a VEVENT before copying, so VTODO/VJOURNAL objects cost nothing
+            if isinstance(ical_data, bytes):
+                if b'BEGIN:VEVENT' not in ical_data:
+                    return []
+                ical_data = ical_data.replace(b'\r\n', b'\n').decode('utf-8', errors='ignore')
+            elif isinstance(ical_data, str):
+                if 'BEGIN:VEVENT' not in ical_data:
+                    return []
+                ical_data = ical_data.replace('\r\n', '\n')
+            else:
                 return []
             
-            # Try to parse
-            from icalendar import Calendar as ICalendar
-            cal = ICalendar.from_ical(ical_text)
-            
-            events = []
-            for component in cal.walk():
-                if component.name == "VEVENT":
-                    event_data = self._parse_ical_component(component, event_url)
-                    if event_data:
-                        # Handle recurring events
-                        if event_data.get('rrule'):
-                            expanded = self._expand_recurring_event(event_data, start_date, end_date)
-                            events.extend(expanded)
-                        else:
-                            events.append(event_data)
+            # Scan the raw text directly, falling back to icalendar for anything unusual
+            parsed_events = self._fast_vevent_scan(ical_data, event_url)
+            if parsed_events is None:
+                cal = Calendar.from_ical(ical_data)
+                parsed_events = [self._parse_ical_component(component, event_url)
+                                 for component in cal.walk('VEVENT')]
             
-            return events
+            return [event_data for event_data in parsed_events if event_data]
                     
         except Exception as e:
-            app.logger.error(f"Error parsing event: {e}")
+            app.logger.error("Error parsing event: %s", e)
             return []
 
+    def _expand_events(self, base_events, start_date, end_date):
+        """Yield the occurrences of parsed base events that overlap a date range"""
+        range_start = start_date.date()
+        range_end = end_date.date()
+        for event_data in base_events:
+            # Handle recurring events
+            if event_data.get('rrule'):
+                # Skip series that start after the window or end before it
+                if to_date(event_data['start']) > range_end:
+                    continue
+                # Bounds are parsed once per distinct RRULE text, not per event and request
+                until, count_span = rrule_bounds(event_data['rrule'])
+                if until is not None:
+                    if (until + (event_data['end'] - event_data['start'])).date() < range_start:
+                        continue
+                elif count_span is not None:
+                    if to_date(event_data['end']) + count_span < range_start:
+                        continue
+                
+                # Occurrences are only generated inside the window, so they need no range check
+                expanded = self._expand_recurring_event(event_data, start_date, end_date)
+                if expanded is not None:
+                    yield from expanded
+                    continue
+            
+            if to_date(event_data['start']) <= range_end and to_date(event_data['end']) >= range_start:
+                yield event_data
+
+    def _vevent_bodies(self, ical_text):
+        """Yield the text between each BEGIN:VEVENT/END:VEVENT pair using plain substring search"""
+        pos = 0
+        while True:
+            begin = ical_text.find('BEGIN:VEVENT\n', pos)
+            if begin < 0:
+                return
+            pos = begin + 13
+            if begin and ical_text[begin - 1] != '\n':
+                continue
+            end = ical_text.find('\nEND:VEVENT', pos - 1)
+            if end < 0:
+                yield None
+                return
+            yield ical_text[pos:end + 1]
+            pos = end + 11
+
+    def _fast_vevent_scan(self, ical_text, event_url):
+        """Extract VEVENT data from raw iCalendar text without building a component tree
+        
+        Expects LF line endings. Returns None when the text needs the full icalendar parser.
+        """
+        events = []
+        
+        # BEGIN/END lines are never folded, so only the VEVENT bodies need unfolding, not VTIMEZONE etc.
+        for body in self._vevent_bodies(ical_text):
+            if body is None:
+                # Unterminated VEVENT
+                return None
+            if '\n ' in body or '\n\t' in body:
+                body = FOLDED_LINE_PATTERN.sub('', body)
+            if 'BEGIN:' in body:
+                # Nested components such as VALARM carry their own DESCRIPTION etc.
+                body = NESTED_COMPONENT_PATTERN.sub('', body)
+            
+            event_data = {
+                'uid': None,
+                'summary': 'Untitled Event',
+                'description': '',
+                'location': '',
+                'url': event_url,
+                'start': None,
+                'end': None,
+                'rrule': None,
+                'exdates': []
+            }
+            
+            for match in VEVENT_PROPERTY_PATTERN.finditer(body):
+                name, params, value = match.groups()
+                if params and params.count('"') % 2:
+                    # Quoted parameter containing a colon
+                    return None
+                
+                key, parse_value = VEVENT_FIELDS[name.upper()]
+                try:
+                    value = parse_value(value)
+                except ValueError:
+                    return None
+                if key == 'exdates':
+                    event_data['exdates'].extend(value)
+                else:
+                    event_data[key] = value
+            
+            if event_data['start'] is None:
+                event_data['start'] = datetime.now()
+            if event_data['end'] is None:
+                event_data['end'] = event_data['start'] + timedelta(hours=1)
+            if event_data['uid'] is None:
+                event_data['uid'] = str(uuid.uuid4())
+            events.append(event_data)
+        
+        return events
+
     def _parse_ical_component(self, component, event_url):
         """Parse an iCalendar component into event data"""
         try:
             # Basic event extraction with fallbacks
             summary = str(component.get('summary', 'Untitled Event'))
-            uid = str(component.get('uid', uuid.uuid4()))
+            # A default argument would generate a throwaway UUID for every event
+            uid = component.get('uid')
+            uid = str(uid) if uid is not None else str(uuid.uuid4())
             description = str(component.get('description', ''))
             location = str(component.get('location', ''))
             
             # Handle dates with fallbacks
             dtstart = component.get('dtstart')
             if dtstart and hasattr(dtstart, 'dt'):
-                start_dt = dtstart.dt
-                if hasattr(start_dt, 'tzinfo') and start_dt.tzinfo:
-                    start_dt = start_dt.replace(tzinfo=None)
+                start_dt = naive(dtstart.dt)
             else:
                 start_dt = datetime.now()
             
             dtend = component.get('dtend')
             if dtend and hasattr(dtend, 'dt'):
-                end_dt = dtend.dt
-                if hasattr(end_dt, 'tzinfo') and end_dt.tzinfo:
-                    end_dt = end_dt.replace(tzinfo=None)
+                end_dt = naive(dtend.dt)
             else:
                 end_dt = start_dt + timedelta(hours=1)
             
@@ -523,17 +1095,18 @@ class CalDAVClient:
                 'exdates': []
             }
             
-            # Simple RRULE handling
+            # Non-recurring events need neither RRULE nor EXDATE handling
             rrule = component.get('rrule')
-            if rrule:
-                try:
-                    if hasattr(rrule, 'to_ical'):
-                        rrule_str = rrule.to_ical().decode('utf-8')
-                    else:
-                        rrule_str = str(rrule)
-                    event_data['rrule'] = rrule_str
-                except:
-                    pass
+            if not rrule:
+                return event_data
+            
+            # vRecur serializes itself; with repeated RRULE lines the last one wins, as in the fast scanner
+            if isinstance(rrule, list):
+                rrule = rrule[-1]
+            try:
+                event_data['rrule'] = rrule.to_ical().decode('utf-8')
+            except Exception:
+                pass
             
             # Extract EXDATE entries
             exdates = component.get('exdate')
@@ -545,30 +1118,22 @@ class CalDAVClient:
                         # Multiple dates in a single vDDDLists object
                         for dt in exdates.dts:
                             if hasattr(dt, 'dt'):
-                                exdate_dt = dt.dt
-                                if hasattr(exdate_dt, 'tzinfo') and exdate_dt.tzinfo:
-                                    exdate_dt = exdate_dt.replace(tzinfo=None)
+                                exdate_dt = naive(dt.dt)
                                 exdate_list.append(exdate_dt)
                     elif hasattr(exdates, 'dt'):
                         # Single datetime
-                        exdate_dt = exdates.dt
-                        if hasattr(exdate_dt, 'tzinfo') and exdate_dt.tzinfo:
-                            exdate_dt = exdate_dt.replace(tzinfo=None)
+                        exdate_dt = naive(exdates.dt)
                         exdate_list.append(exdate_dt)
                     elif isinstance(exdates, list):
                         # List of EXDATE entries
                         for exdate in exdates:
                             if hasattr(exdate, 'dt'):
-                                exdate_dt = exdate.dt
-                                if hasattr(exdate_dt, 'tzinfo') and exdate_dt.tzinfo:
-                                    exdate_dt = exdate_dt.replace(tzinfo=None)
+                                exdate_dt = naive(exdate.dt)
                                 exdate_list.append(exdate_dt)
                             elif hasattr(exdate, 'dts'):
                                 for dt in exdate.dts:
                                     if hasattr(dt, 'dt'):
-                                        exdate_dt = dt.dt
-                                        if hasattr(exdate_dt, 'tzinfo') and exdate_dt.tzinfo:
-                                            exdate_dt = exdate_dt.replace(tzinfo=None)
+                                        exdate_dt = naive(dt.dt)
                                         exdate_list.append(exdate_dt)
                     else:
                         # Try direct conversion
@@ -581,176 +1146,115 @@ class CalDAVClient:
                     event_data['exdates'] = exdate_list
                     
                 except Exception as e:
-                    app.logger.error(f"Error parsing EXDATE for event {summary}: {e}")
+                    app.logger.error("Error parsing EXDATE for event %s: %s", summary, e)
             
             return event_data
             
         except Exception as e:
-            app.logger.error(f"Error parsing iCalendar component: {e}")
+            app.logger.error("Error parsing iCalendar component: %s", e)
             return None
 
     def _expand_recurring_event(self, base_event, start_date, end_date):
-        """Expand a recurring event into individual occurrences"""
+        """Expand a recurring event into the occurrences inside a date range
+        
+        Returns None when the rule cannot be expanded, so the caller treats the event as a single one.
+        """
         try:
-            events = []
             rrule_text = base_event['rrule']
+            if 'FREQ=' not in rrule_text:
+                return None
             
-            # Simple RRULE parsing
-            rrule_parts = {}
-            if rrule_text.startswith('FREQ='):
-                for part in rrule_text.split(';'):
-                    if '=' in part:
-                        key, value = part.split('=', 1)
-                        rrule_parts[key.upper()] = value.upper() if key.upper() == 'FREQ' else value
-            else:
-                return [base_event]
-            
-            freq = rrule_parts.get('FREQ', '').upper()
-            interval = int(rrule_parts.get('INTERVAL', 1))
-            count = int(rrule_parts.get('COUNT', 0)) if rrule_parts.get('COUNT') else None
-            until_str = rrule_parts.get('UNTIL', '')
-            
-            # Parse UNTIL date
-            until_date = None
-            if until_str:
-                until_date = self._parse_date(until_str)
+            # Ensure timezone-naive dates
+            start_date = naive(start_date)
+            end_date = naive(end_date)
             
-            # Get EXDATE list from base event if it exists
-            exdates = base_event.get('exdates', [])
+            # All-day events recur on dates, dateutil works on datetimes
+            dtstart = base_event['start']
+            all_day = not isinstance(dtstart, datetime)
+            if all_day:
+                dtstart = datetime.combine(dtstart, datetime.min.time())
             
             # Calculate event duration
             duration = base_event['end'] - base_event['start']
             
-            # Generate occurrences
-            current_date = base_event['start']
-            occurrence_count = 0
-            max_occurrences = count if count else 100
+            # Collect EXDATE days once so each occurrence is a set lookup
+            excluded_dates = {to_date(exdate) for exdate in base_event.get('exdates', [])}
             
-            # Ensure timezone-naive dates
-            if hasattr(start_date, 'tzinfo') and start_date.tzinfo:
-                start_date = start_date.replace(tzinfo=None)
-            if hasattr(end_date, 'tzinfo') and end_date.tzinfo:
-                end_date = end_date.replace(tzinfo=None)
-            if hasattr(current_date, 'tzinfo') and current_date.tzinfo:
-                current_date = current_date.replace(tzinfo=None)
-            if until_date and hasattr(until_date, 'tzinfo') and until_date.tzinfo:
-                until_date = until_date.replace(tzinfo=None)
+            # Only occurrences overlapping the requested days are generated
+            window_start = datetime.combine(start_date.date(), datetime.min.time()) - duration
+            window_end = datetime.combine(end_date.date(), datetime.max.time())
+            rule_parts = plain_rule_parts(rrule_text)
+            # Plain rules are an arithmetic progression in days or months, no dateutil iteration needed
+            occurrences = None if rule_parts is None else plain_rule_occurrences(
+                rule_parts, dtstart, window_start, window_end, 1000
+            )
+            if occurrences is None:
+                # dateutil iterates from DTSTART, so long-running series start near the window instead
+                rule = compile_rrule(rrule_text, fast_forward_dtstart(rrule_text, dtstart, window_start))
+                # Safety cap for very high frequency rules
+                occurrences = rule.xafter(window_start, count=1000, inc=True)
             
-            # Expand date range to catch overlapping events
-            expanded_start = start_date - timedelta(days=60)
-            expanded_end = end_date + timedelta(days=60)
+            # Fields shared by every occurrence are set once, not per copy
+            uid = base_event['uid']
+            occurrence_template = dict(base_event, is_recurring=True, original_uid=uid)
+            uid_prefix = f"{uid}_recurrence_"
+            # All-day occurrences are dates, whose ISO form has no time to fold into the UID
+            uid_suffix = 'T000000' if all_day else ''
             
-            while (occurrence_count < max_occurrences and 
-                   current_date <= expanded_end and
-                   (not until_date or current_date <= until_date)):
-                
-                event_end = current_date + duration
-                
-                # Check if this occurrence should be excluded by EXDATE
-                is_excluded = False
-                for exdate in exdates:
-                    # Compare dates, handling both datetime and date objects
-                    if hasattr(exdate, 'date'):
-                        exdate_date = exdate.date()
-                    else:
-                        exdate_date = exdate
-                    
-                    if hasattr(current_date, 'date'):
-                        current_date_date = current_date.date()
-                    else:
-                        current_date_date = current_date
-                    
-                    if exdate_date == current_date_date:
-                        is_excluded = True
-                        break
-                
-                # Only add if not excluded and within date range
-                if not is_excluded and (current_date.date() <= end_date.date() and 
-                                       event_end.date() >= start_date.date()):
-                    
-                    event_copy = base_event.copy()
-                    event_copy['start'] = current_date
-                    event_copy['end'] = event_end
-                    event_copy['uid'] = f"{base_event['uid']}_recurrence_{occurrence_count}"
-                    event_copy['is_recurring'] = True
-                    event_copy['original_uid'] = base_event['uid']
-                    event_copy['recurrence_id'] = occurrence_count
-                    events.append(event_copy)
-                
-                occurrence_count += 1
-                
-                # Calculate next occurrence
-                if freq == 'DAILY':
-                    current_date += timedelta(days=interval)
-                elif freq == 'WEEKLY':
-                    current_date += timedelta(weeks=interval)
-                elif freq == 'MONTHLY':
-                    month = current_date.month + interval
-                    year = current_date.year
-                    while month > 12:
-                        month -= 12
-                        year += 1
-                    try:
-                        current_date = current_date.replace(year=year, month=month)
-                    except ValueError:
-                        # Handle day overflow
-                        import calendar
-                        last_day = calendar.monthrange(year, month)[1]
-                        day = min(current_date.day, last_day)
-                        current_date = current_date.replace(year=year, month=month, day=day)
-                elif freq == 'YEARLY':
-                    try:
-                        current_date = current_date.replace(year=current_date.year + interval)
-                    except ValueError:
-                        # Handle leap year issues
-                        current_date = current_date.replace(year=current_date.year + interval, day=28)
-                else:
+            events = []
+            append_event = events.append
+            for occurrence in occurrences:
+                if occurrence > window_end:
                     break
+                if all_day:
+                    occurrence = occurrence.date()
+                if excluded_dates and to_date(occurrence) in excluded_dates:
+                    continue
                 
-                # Safety check
-                if occurrence_count > 1000:
-                    break
+                # Derive the YYYYMMDDTHHMMSS UID stamp from the ISO string rather than a second strftime
+                recurrence_id = occurrence.isoformat()
+                append_event({
+                    **occurrence_template,
+                    'start': occurrence,
+                    'end': occurrence + duration,
+                    'uid': uid_prefix + recurrence_id.replace('-', '').replace(':', '') + uid_suffix,
+                    'recurrence_id': recurrence_id
+                })
             
             return events
             
         except Exception as e:
-            app.logger.error(f"Error expanding recurring event: {e}")
-            return [base_event]
+            app.logger.error("Error expanding recurring event: %s", e)
+            return None
 
     def _parse_date(self, date_str):
         """Parse date string with multiple format support"""
         if not date_str or not isinstance(date_str, str):
             return None
         
+        date_str = date_str.strip()
+        
+        # Well-formed values go through the C fromisoformat parser before the regex
         try:
-            # Clean the string
-            date_str = date_str.strip().replace('T', '').replace('Z', '').replace('-', '').replace(':', '')
-            
-            # Extract numeric parts
-            if len(date_str) >= 8:
-                year = int(date_str[:4])
-                month = int(date_str[4:6])
-                day = int(date_str[6:8])
-                
-                hour = 0
-                minute = 0
-                second = 0
-                
-                if len(date_str) >= 10:
-                    hour = int(date_str[8:10])
-                if len(date_str) >= 12:
-                    minute = int(date_str[10:12])
-                if len(date_str) >= 14:
-                    second = int(date_str[12:14])
-                
-                # Validate ranges
-                if (1900 <= year <= 2100 and 1 <= month <= 12 and 1 <= day <= 31 and
-                    0 <= hour <= 23 and 0 <= minute <= 59 and 0 <= second <= 59):
-                    return datetime(year, month, day, hour, minute, second)
-            
+            parsed = datetime.fromisoformat(date_str.removesuffix('Z')).replace(microsecond=0, tzinfo=None)
+        except ValueError:
+            parsed = None
+        if parsed is not None:
+            return parsed if 1900 <= parsed.year <= 2100 else None
+        
+        # Basic (20240101T100000Z) and extended (2024-01-01T10:00:00) forms in one match
+        match = ICAL_DATE_PATTERN.match(date_str)
+        if not match:
             return None
-            
-        except Exception:
+        
+        year, month, day, hour, minute, second = (int(part) for part in match.groups(default='0'))
+        
+        # Validate ranges
+        if not 1900 <= year <= 2100:
+            return None
+        try:
+            return datetime(year, month, day, hour, minute, second)
+        except ValueError:
             return None
 
     def create_event(self, summary, description, location, start_dt, end_dt, rrule=None):
@@ -761,10 +1265,8 @@ class CalDAVClient:
         
         try:
             # Ensure timezone-naive datetimes for CalDAV compatibility
-            if hasattr(start_dt, 'tzinfo') and start_dt.tzinfo:
-                start_dt = start_dt.replace(tzinfo=None)
-            if hasattr(end_dt, 'tzinfo') and end_dt.tzinfo:
-                end_dt = end_dt.replace(tzinfo=None)
+            start_dt = naive(start_dt)
+            end_dt = naive(end_dt)
             
             cal = Calendar()
             cal.add('prodid', '-//CalDAV Web Client//Enhanced//')
@@ -777,7 +1279,7 @@ class CalDAVClient:
                 event.add('location', location)
             event.add('dtstart', start_dt)
             event.add('dtend', end_dt)
-            event.add('dtstamp', datetime.now(pytz.UTC).replace(tzinfo=None))
+            event.add('dtstamp', datetime.now(timezone.utc).replace(tzinfo=None))
             event.add('uid', str(uuid.uuid4()))
             
             # Add recurrence rule if provided
@@ -788,7 +1290,7 @@ class CalDAVClient:
                         recur = vRecur(rrule_dict)
                         event.add('rrule', recur)
                 except Exception as e:
-                    app.logger.error(f"Error adding RRULE: {e}")
+                    app.logger.error("Error adding RRULE: %s", e)
             
             cal.add_component(event)
             ical_data = cal.to_ical()
@@ -798,57 +1300,187 @@ class CalDAVClient:
             return True
                 
         except Exception as e:
-            app.logger.error(f"Error creating event: {e}")
+            app.logger.exception("Error creating event: %s", e)
             return False
 
     def _parse_rrule_string(self, rrule_string):
         """Parse RRULE string into dictionary format"""
         try:
             rrule_dict = {}
-            parts = rrule_string.split(';')
             
-            for part in parts:
-                if '=' in part:
-                    key, value = part.split('=', 1)
-                    key = key.upper().strip()
-                    value = value.strip()
-                    
-                    if key == 'FREQ':
-                        rrule_dict[key] = value.upper()
-                    elif key in ['INTERVAL', 'COUNT']:
-                        try:
-                            rrule_dict[key] = int(value)
-                        except ValueError:
-                            continue
-                    elif key == 'UNTIL':
-                        until_date = self._parse_date(value)
-                        if until_date:
-                            rrule_dict[key] = until_date
-                    else:
-                        rrule_dict[key] = value
+            # One regex scan yields every NAME=value pair
+            for key, value in RRULE_PART_PATTERN.findall(rrule_string):
+                key = key.upper()
+                value = value.strip()
+                
+                if key == 'FREQ':
+                    rrule_dict[key] = value.upper()
+                elif key in RRULE_INT_PARTS:
+                    try:
+                        rrule_dict[key] = int(value)
+                    except ValueError:
+                        continue
+                elif key == 'UNTIL':
+                    until_date = self._parse_date(value)
+                    if until_date:
+                        rrule_dict[key] = until_date
+                else:
+                    rrule_dict[key] = value
             
             return rrule_dict if rrule_dict else None
         except Exception as e:
-            app.logger.error(f"Error parsing RRULE string: {e}")
+            app.logger.error("Error parsing RRULE string: %s", e)
             return None
 
 
+@lru_cache(maxsize=256)
 def get_caldav_url(username, base_url, server_type):
     """Generate CalDAV URL based on server type"""
-    pattern = CALDAV_URL_PATTERNS.get(server_type, CALDAV_URL_PATTERNS['generic'])
+    pattern = CALDAV_URL_PATTERNS.get(server_type, DEFAULT_CALDAV_URL_PATTERN)
     return pattern.format(base_url=base_url, username=username)
 
+@lru_cache(maxsize=256)
+def format_rrule_until(until_day):
+    """Turn a YYYY-MM-DD end day into an RRULE UNTIL value covering the whole day"""
+    try:
+        return datetime.fromisoformat(until_day + 'T23:59:59').strftime('%Y%m%dT%H%M%SZ')
+    except ValueError:
+        return None
+
+def build_rrule(data):
+    """Build an RRULE string from the event form's recurrence fields, or None"""
+    frequency = data.get('recurring')
+    if not frequency or frequency == 'none':
+        return None
+    
+    rrule = f"FREQ={frequency.upper()}"
+    
+    interval = data.get('recurring_interval')
+    if interval and int(interval) > 1:
+        rrule += f";INTERVAL={interval}"
+    
+    if data.get('recurring_count'):
+        rrule += f";COUNT={data['recurring_count']}"
+    elif isinstance(data.get('recurring_until'), str) and data['recurring_until']:
+        until = format_rrule_until(data['recurring_until'])
+        if until:
+            rrule += f";UNTIL={until}"
+    
+    return rrule
+
 def get_user_preferences():
     """Get user preferences from session with defaults"""
-    return session.get('user_preferences', {
-        'week_start': 0,
-        'calendar_colors': {},
-        'default_calendar': None,
-        'default_view': 'dayGridMonth',
-        'timezone': 'UTC',
-        'selected_calendars': [],
-        'available_calendars': []
-    })
+    prefs = session.get('user_preferences')
+    if prefs is None:
+        # Defaults are only built when the session has none; callers mutate them, so never shared
+        prefs = {
+            'week_start': 0,
+            'calendar_colors': {},
+            'default_calendar': None,
+            'default_view': 'dayGridMonth',
+            'timezone': 'UTC',
+            'selected_calendars': [],
+            'available_calendars': []
+        }
+    return prefs
+
+def session_credentials():
+    """Return the session's (username, password, caldav_url, server_type), or None if any is missing"""
+    try:
+        return (session['username'], session['password'],
+                session['caldav_url'], session.get('server_type', 'generic'))
+    except KeyError:
+        return None
+
+def get_client(credentials):
+    """Return a connected CalDAVClient for the given credentials, or None if connecting fails"""
+    client = CalDAVClient(*credentials)
+    return client if client.connect() else None
+
+def fetch_calendar_events(credentials, calendar_name, calendar_url, color, start_dt, end_dt):
+    """Fetch one calendar's events formatted for FullCalendar
+    
+    Runs on a worker thread, so it gets its own CalDAVClient (select_calendar mutates it)
+    and shares the pooled connection through CONNECTION_CACHE.
+    """
+    client = CalDAVClient(*credentials)
+    if not client.connect() or not client.select_calendar(calendar_name, calendar_url):
+        return []
+    
+    # A dict display with constant keys is the cheapest way to build these; the id prefix is built once
+    id_prefix = f"{calendar_name}:"
+    return [
+        {
+            'id': id_prefix + event['uid'],
+            'title': event['summary'],
+            'start': event['start'],
+            'end': event['end'],
+            'description': event['description'],
+            'location': event['location'],
+            'url': event['url'],
+            'backgroundColor': color,
+            'borderColor': color,
+            'calendar_name': calendar_name,
+            'is_recurring': event.get('is_recurring', False),
+            'original_uid': event.get('original_uid', event['uid'])
+        }
+        for event in client.get_events(start_dt, end_dt)
+    ]
+
+def fetch_calendar_freebusy(credentials, calendar_name, calendar_url, start_dt, end_dt):
+    """Fetch one calendar's busy periods, on its own CalDAVClient like fetch_calendar_events"""
+    client = CalDAVClient(*credentials)
+    if not client.connect() or not client.select_calendar(calendar_name, calendar_url):
+        return []
+    return [{'start': busy_start, 'end': busy_end}
+            for busy_start, busy_end in client.get_freebusy(start_dt, end_dt)]
+
+def fetch_selected_calendars(credentials, jobs, start_dt, end_dt, fetch=fetch_calendar_events):
+    """Run fetch for each (calendar name, URL, ...) job concurrently, yielding each result as it finishes"""
+    if not jobs:
+        return
+    
+    if len(jobs) == 1:
+        # Nothing to overlap with, so skip starting a thread pool
+        try:
+            yield fetch(credentials, *jobs[0], start_dt, end_dt)
+        except Exception as e:
+            app.logger.exception("Error fetching calendar data: %s", e)
+        return
+    
+    # Each calendar is its own REPORT round trip
+    with ThreadPoolExecutor(max_workers=min(CALENDAR_FETCH_WORKERS, len(jobs))) as executor:
+        futures = [executor.submit(fetch, credentials, *job, start_dt, end_dt) for job in jobs]
+        for future in as_completed(futures):
+            try:
+                yield future.result()
+            except Exception as e:
+                app.logger.exception("Error fetching calendar data: %s", e)
+
+def stream_events_json(event_batches):
+    """Yield a JSON array piece by piece, one chunk per batch of events"""
+    yield '['
+    first = True
+    for events in event_batches:
+        if not events:
+            continue
+        # Serialize the whole batch at once and drop its brackets
+        chunk = app.json.dumps(events)[1:-1]
+        yield chunk if first else ',' + chunk
+        first = False
+    yield ']'
+
+def events_response(event_batches):
+    """Stream event batches as a JSON array, or send MessagePack when the client prefers it"""
+    if (MSGPACK_ENCODER is not None and
+            request.accept_mimetypes.best_match(['application/json', MSGPACK_MIMETYPE]) == MSGPACK_MIMETYPE):
+        events = list(itertools.chain.from_iterable(event_batches))
+        return app.response_class(MSGPACK_ENCODER.encode(events), mimetype=MSGPACK_MIMETYPE)
+    return app.response_class(stream_events_json(event_batches), mimetype='application/json')
+
+def get_calendar_urls(prefs):
+    """Map calendar display names to the URLs listed at login"""
+    return dict(prefs.get('available_calendars', []))
 
 def save_user_preferences(preferences):
     """Save user preferences to session"""
@@ -892,7 +1524,6 @@ def login():
                 session.permanent = True
                 session['username'] = username
                 session['password'] = password
-                session['server_url'] = server_url
                 session['server_type'] = server_type
                 session['caldav_url'] = caldav_url
                 
@@ -961,58 +1592,35 @@ def api_events():
             return jsonify({'error': 'Missing date parameters'}), 400
         
         try:
-            start_dt = datetime.fromisoformat(start_date.replace('Z', '+00:00'))
-            end_dt = datetime.fromisoformat(end_date.replace('Z', '+00:00'))
+            start_dt = parse_iso_utc(start_date)
+            end_dt = parse_iso_utc(end_date)
         except ValueError:
             return jsonify({'error': 'Invalid date format'}), 400
         
         # Check session data
-        if not all(key in session for key in ['username', 'password', 'caldav_url']):
+        credentials = session_credentials()
+        if credentials is None:
             return jsonify({'error': 'Session incomplete'}), 401
         
-        client = CalDAVClient(session['username'], session['password'], 
-                             session['caldav_url'], session.get('server_type', 'generic'))
-        
-        if not client.connect():
+        client = get_client(credentials)
+        if client is None:
             return jsonify({'error': 'CalDAV connection failed'}), 500
         
-        # Get events from all selected calendars
-        all_events = []
+        # Read the session-backed preferences once for the whole request
         prefs = get_user_preferences()
         selected_calendars = prefs.get('selected_calendars', [])
         calendar_colors = prefs.get('calendar_colors', {})
+        calendar_urls = get_calendar_urls(prefs)
         
-        # Default colors
-        default_colors = [
-            '#3788d8', '#28a745', '#dc3545', '#ffc107', '#6f42c1',
-            '#fd7e14', '#20c997', '#e83e8c', '#6c757d', '#17a2b8'
+        jobs = [
+            (calendar_name, calendar_urls.get(calendar_name),
+             calendar_colors.get(calendar_name, default_color))
+            for calendar_name, default_color in zip(selected_calendars,
+                                                    itertools.cycle(DEFAULT_CALENDAR_COLORS))
         ]
         
-        for i, calendar_name in enumerate(selected_calendars):
-            if client.select_calendar(calendar_name):
-                events = client.get_events(start_dt, end_dt)
-                
-                color = calendar_colors.get(calendar_name, 
-                                          default_colors[i % len(default_colors)])
-                
-                for event in events:
-                    formatted_event = {
-                        'id': f"{calendar_name}:{event['uid']}",
-                        'title': event['summary'],
-                        'start': event['start'].isoformat(),
-                        'end': event['end'].isoformat(),
-                        'description': event['description'],
-                        'location': event.get('location', ''),
-                        'url': event['url'],
-                        'backgroundColor': color,
-                        'borderColor': color,
-                        'calendar_name': calendar_name,
-                        'is_recurring': event.get('is_recurring', False),
-                        'original_uid': event.get('original_uid', event['uid'])
-                    }
-                    all_events.append(formatted_event)
-        
-        return jsonify(all_events)
+        # Calendars are written out as they finish, so the first bytes leave before the slowest one
+        return events_response(fetch_selected_calendars(credentials, jobs, start_dt, end_dt))
     
     elif request.method == 'POST':
         # Create event functionality
@@ -1024,8 +1632,8 @@ def api_events():
             return jsonify({'error': 'No data provided'}), 400
         
         try:
-            start_dt = datetime.fromisoformat(data['start'].replace('Z', '+00:00'))
-            end_dt = datetime.fromisoformat(data['end'].replace('Z', '+00:00'))
+            start_dt = parse_iso_utc(data['start'])
+            end_dt = parse_iso_utc(data['end'])
         except (ValueError, KeyError):
             return jsonify({'error': 'Invalid date format'}), 400
         
@@ -1036,43 +1644,28 @@ def api_events():
             if prefs.get('default_calendar'):
                 target_calendar = prefs['default_calendar']
             else:
-                selected_calendars = prefs.get('selected_calendars', [])
-                if selected_calendars:
-                    target_calendar = selected_calendars[0]
+                # Fall back to the calendar list cached at login rather than asking the server
+                candidates = (prefs.get('selected_calendars') or
+                              [cal[0] for cal in prefs.get('available_calendars', [])])
+                if candidates:
+                    target_calendar = candidates[0]
                 else:
                     return jsonify({'error': 'No calendars available'}), 400
         
         # Check session data
-        if not all(key in session for key in ['username', 'password', 'caldav_url']):
+        credentials = session_credentials()
+        if credentials is None:
             return jsonify({'error': 'Session incomplete'}), 401
         
-        client = CalDAVClient(session['username'], session['password'], 
-                             session['caldav_url'], session.get('server_type', 'generic'))
-        
-        if not client.connect():
+        client = get_client(credentials)
+        if client is None:
             return jsonify({'error': 'CalDAV connection failed'}), 500
         
-        if not client.select_calendar(target_calendar):
+        if not client.select_calendar(target_calendar, get_calendar_urls(prefs).get(target_calendar)):
             return jsonify({'error': f'Calendar "{target_calendar}" not found'}), 500
         
         # Build RRULE string if recurrence is specified
-        rrule = None
-        if data.get('recurring') and data.get('recurring') != 'none':
-            rrule_parts = [f"FREQ={data['recurring'].upper()}"]
-            
-            if data.get('recurring_interval') and int(data.get('recurring_interval', 1)) > 1:
-                rrule_parts.append(f"INTERVAL={data['recurring_interval']}")
-            
-            if data.get('recurring_count'):
-                rrule_parts.append(f"COUNT={data['recurring_count']}")
-            elif data.get('recurring_until'):
-                try:
-                    until_date = datetime.fromisoformat(data['recurring_until'] + 'T23:59:59')
-                    rrule_parts.append(f"UNTIL={until_date.strftime('%Y%m%dT%H%M%SZ')}")
-                except Exception:
-                    pass
-            
-            rrule = ';'.join(rrule_parts)
+        rrule = build_rrule(data)
         
         # Create the event
         try:
@@ -1091,9 +1684,48 @@ def api_events():
                 return jsonify({'error': 'Failed to create event'}), 500
                 
         except Exception as e:
-            app.logger.error(f"Exception during event creation: {e}")
+            app.logger.exception("Exception during event creation: %s", e)
             return jsonify({'error': f'Error creating event: {str(e)}'}), 500
 
+@app.route('/api/freebusy', methods=['GET'])
+def api_freebusy():
+    """API endpoint returning busy periods across the selected calendars"""
+    if 'username' not in session:
+        return jsonify({'error': 'Not authenticated'}), 401
+    
+    start_date = request.args.get('start')
+    end_date = request.args.get('end')
+    
+    if not start_date or not end_date:
+        return jsonify({'error': 'Missing date parameters'}), 400
+    
+    try:
+        start_dt = parse_iso_utc(start_date)
+        end_dt = parse_iso_utc(end_date)
+    except ValueError:
+        return jsonify({'error': 'Invalid date format'}), 400
+    
+    # Check session data
+    credentials = session_credentials()
+    if credentials is None:
+        return jsonify({'error': 'Session incomplete'}), 401
+    
+    client = get_client(credentials)
+    if client is None:
+        return jsonify({'error': 'CalDAV connection failed'}), 500
+    
+    prefs = get_user_preferences()
+    calendar_urls = get_calendar_urls(prefs)
+    jobs = [(calendar_name, calendar_urls.get(calendar_name))
+            for calendar_name in prefs.get('selected_calendars', [])]
+    
+    # One free/busy REPORT per calendar, issued side by side like /api/events
+    busy = [period
+            for periods in fetch_selected_calendars(credentials, jobs, start_dt, end_dt,
+                                                    fetch_calendar_freebusy)
+            for period in periods]
+    return jsonify(busy)
+
 @app.route('/api/events/<path:event_id>', methods=['DELETE'])
 def api_delete_event(event_id):
     """API endpoint to delete event with recurring options support"""
@@ -1102,11 +1734,11 @@ def api_delete_event(event_id):
     if 'username' not in session:
         return jsonify({'error': 'Not authenticated'}), 401
     
+    prefs = get_user_preferences()
+    
     # Extract calendar name from event ID
-    if ':' in event_id:
-        calendar_name, uid = event_id.split(':', 1)
-    else:
-        prefs = get_user_preferences()
+    calendar_name, separator, uid = event_id.partition(':')
+    if not separator:
         selected_calendars = prefs.get('selected_calendars', [])
         calendar_name = selected_calendars[0] if selected_calendars else None
         uid = event_id
@@ -1126,17 +1758,16 @@ def api_delete_event(event_id):
     original_uid = data.get('originalUid')
     
     # Check session data
-    if not all(key in session for key in ['username', 'password', 'caldav_url']):
+    credentials = session_credentials()
+    if credentials is None:
         return jsonify({'error': 'Session incomplete'}), 401
     
     try:
-        client = CalDAVClient(session['username'], session['password'], 
-                             session['caldav_url'], session.get('server_type', 'generic'))
-        
-        if not client.connect():
+        client = get_client(credentials)
+        if client is None:
             return jsonify({'error': 'CalDAV connection failed'}), 500
         
-        if not client.select_calendar(calendar_name):
+        if not client.select_calendar(calendar_name, get_calendar_urls(prefs).get(calendar_name)):
             return jsonify({'error': f'Calendar "{calendar_name}" not found'}), 500
         
         # Handle different delete types
@@ -1144,7 +1775,7 @@ def api_delete_event(event_id):
         
         if delete_type == 'single' or not event_url:
             # For single events or when we don't have the event URL
-            success = client.delete_event_by_uid(uid)
+            success = client.delete_event_by_uid(uid, event_url)
         elif delete_type == 'this':
             if not original_uid or not event_date:
                 return jsonify({'error': 'Missing original UID or event date'}), 400
@@ -1156,7 +1787,7 @@ def api_delete_event(event_id):
         elif delete_type == 'all':
             if not original_uid:
                 return jsonify({'error': 'Missing original UID'}), 400
-            success = client.delete_recurring_series(original_uid)
+            success = client.delete_recurring_series(original_uid, event_url)
         else:
             return jsonify({'error': f'Invalid delete type: {delete_type}'}), 400
         
@@ -1166,7 +1797,7 @@ def api_delete_event(event_id):
             return jsonify({'error': f'Failed to delete event (type: {delete_type})'}), 500
             
     except Exception as e:
-        app.logger.error(f"Exception during deletion: {e}")
+        app.logger.exception("Exception during deletion: %s", e)
         return jsonify({'error': f'Exception during deletion: {str(e)}'}), 500
 
 @app.route('/api/calendar-selection', methods=['GET'])
@@ -1247,16 +1878,51 @@ def update_settings():
 @app.route('/logout')
 def logout():
     """Logout and clear session"""
+    forget_connection((session.get('username'), session.get('password'), session.get('caldav_url')))
     session.clear()
     return redirect(url_for('login'))
 
+def gzip_stream(chunks):
+    """Gzip an iterable of str/bytes chunks, flushing after each so clients can decode as it arrives"""
+    compressor = zlib.compressobj(COMPRESS_LEVEL, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+    for chunk in chunks:
+        if isinstance(chunk, str):
+            chunk = chunk.encode('utf-8')
+        yield compressor.compress(chunk) + compressor.flush(zlib.Z_SYNC_FLUSH)
+    yield compressor.flush()
+
+@app.after_request
+def compress_response(response):
+    """Gzip larger JSON responses for clients that accept it"""
+    if (response.direct_passthrough or response.status_code != 200 or
+            response.mimetype != 'application/json' or 'Content-Encoding' in response.headers or
+            'gzip' not in request.headers.get('Accept-Encoding', '')):
+        return response
+    
+    if response.is_streamed:
+        # Compress chunk by chunk so the stream keeps flowing
+        response.response = gzip_stream(response.response)
+        response.headers.pop('Content-Length', None)
+        response.headers['Content-Encoding'] = 'gzip'
+        response.vary.add('Accept-Encoding')
+        return response
+    
+    data = response.get_data()
+    if len(data) < COMPRESS_MIN_SIZE:
+        return response
+    
+    response.set_data(gzip.compress(data, compresslevel=COMPRESS_LEVEL))
+    response.headers['Content-Encoding'] = 'gzip'
+    response.vary.add('Accept-Encoding')
+    return response
+
 @app.errorhandler(404)
 def not_found(error):
     return jsonify({'error': 'Not found'}), 404
 
 @app.errorhandler(500)
 def internal_error(error):
-    app.logger.error(f"Internal error: {error}")
+    app.logger.error("Internal error: %s", error)
     return jsonify({'error': 'Internal server error'}), 500
 
 if __name__ == '__main__':
@@ -1264,5 +1930,5 @@ if __name__ == '__main__':
     port = int(os.environ.get('PORT', 5000))
     debug = os.environ.get('FLASK_ENV') == 'development'
     
-    app.logger.info(f"Starting CalDAV Web Client on 0.0.0.0:{port}")
+    app.logger.info("Starting CalDAV Web Client on 0.0.0.0:%s", port)
     app.run(host='0.0.0.0', port=port, debug=debug)
\ No newline at end of file
@@ -12,7 +12,9 @@ backlog = 2048
 
 # Worker processes
 workers = multiprocessing.cpu_count() * 2 + 1
-worker_class = "sync"
+# Requests mostly wait on the CalDAV server, so threads let one worker serve many at once
+worker_class = "gthread"
+threads = int(os.environ.get('GUNICORN_THREADS', 8))
 worker_connections = 1000
 timeout = 30
 keepalive = 2